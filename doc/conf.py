@@ -1,23 +1,19 @@
-# -*- coding: utf-8 -*-
-#
 # latexcodec documentation build configuration file, created by
 # sphinx-quickstart on Wed Aug  3 15:45:22 2011.
 
+from pathlib import Path
+
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.doctest",
     "sphinx.ext.intersphinx",
-    "sphinx.ext.todo",
-    "sphinx.ext.coverage",
-    "sphinx.ext.imgmath",
     "sphinx.ext.viewcode",
 ]
 source_suffix = ".rst"
 master_doc = "index"
 project = "latexcodec"
 copyright = "2011-2024, Matthias C. M. Troffaes"
-with open("../VERSION") as version_file:
-    release = version_file.read().strip()
+release = (Path(__file__).resolve().parent.parent / "VERSION").read_text().strip()
 version = ".".join(release.split(".")[:2])
 exclude_patterns = ["_build"]
 pygments_style = "sphinx"
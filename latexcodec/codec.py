@@ -59,10 +59,23 @@
 
 import codecs
 import dataclasses
+import functools
 import importlib.resources as pkg_resources
+import re
 import unicodedata
 from codecs import CodecInfo
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
 
 from latexcodec import lexer
 
@@ -113,14 +126,59 @@ def load_unicode_latex_table() -> Iterator[UnicodeLatexTranslation]:
             )
 
 
+def _translate_char(
+    latex_map: Dict[str, Tuple[str, Tuple[lexer.Token, ...]]], inputenc: str, c: str
+) -> Optional[Tuple[str, Tuple[lexer.Token, ...]]]:
+    """Translate a single character, or return ``None`` if
+    it has no translation.
+    """
+    # if ascii, try latex equivalents
+    # (this covers \, #, &, and other special LaTeX characters)
+    if ord(c) < 128:
+        try:
+            return latex_map[c]
+        except KeyError:
+            pass
+    # next, try input encoding
+    try:
+        c.encode(inputenc, "strict")
+    except UnicodeEncodeError:
+        pass
+    else:
+        return c, (lexer.Token(name="chars", text=c),)
+    # next, try latex equivalents of common unicode characters
+    return latex_map.get(c)
+
+
 class LatexUnicodeTable:
-    """Tabulates a translation between LaTeX and unicode."""
+    """Tabulates a translation between LaTeX and unicode.
+
+    Translations must be added through :meth:`register`, which also
+    updates :attr:`unicode_trie` and the encoder caches derived from
+    :attr:`latex_map`; changing :attr:`unicode_map` or :attr:`latex_map`
+    directly has no effect on decoding or encoding.
+    """
+
+    __slots__ = (
+        "lexer",
+        "unicode_map",
+        "unicode_trie",
+        "max_length",
+        "latex_map",
+        "_plain_regexp",
+        "_char_translator",
+    )
 
     def __init__(self, lexer_):
         self.lexer: lexer.LatexIncrementalLexer = lexer_
         self.unicode_map: Dict[Tuple[lexer.Token, ...], str] = {}
+        self.unicode_trie: Dict[Optional[lexer.Token], Any] = {}
         self.max_length: int = 0
         self.latex_map: Dict[str, Tuple[str, Tuple[lexer.Token, ...]]] = {}
+        self._plain_regexp: Optional[Pattern[str]] = None
+        self._char_translator: Optional[
+            Callable[[str, str], Optional[Tuple[str, Tuple[lexer.Token, ...]]]]
+        ] = None
         self.register_all()
 
     def register_all(self):
@@ -188,6 +246,12 @@ class LatexUnicodeTable:
             if tokens not in self.unicode_map:
                 self.max_length = max(self.max_length, len(tokens))
                 self.unicode_map[tokens] = trans.unicode
+                # the trie has the same content as unicode_map:
+                # nested dicts keyed by token, value stored under None
+                node = self.unicode_trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[None] = trans.unicode
             # also register token variant with brackets, if appropriate
             # for instance, "\'{e}" for "\'e", "\c{c}" for "\c c", etc.
             # note: we do not remove brackets (they sometimes matter,
@@ -229,10 +293,45 @@ class LatexUnicodeTable:
         if trans.encode and trans.unicode not in self.latex_map:
             assert len(trans.unicode) == 1
             self.latex_map[trans.unicode] = (trans.latex, tokens)
+            self._plain_regexp = None
+            self._char_translator = None
+
+    def get_plain_regexp(self) -> Pattern[str]:
+        """Regular expression matching runs of ascii characters that
+        have no LaTeX translation, and therefore encode as themselves.
+        The expression is rebuilt by :meth:`register` only, and ignores
+        direct changes to :attr:`latex_map`.
+        """
+        if self._plain_regexp is None:
+            specials = "".join(c for c in self.latex_map if c < "\x80")
+            self._plain_regexp = re.compile(
+                "[^" + re.escape(specials) + "\x80-\U0010ffff]+"
+            )
+        return self._plain_regexp
+
+    def get_char_translator(
+        self,
+    ) -> Callable[[str, str], Optional[Tuple[str, Tuple[lexer.Token, ...]]]]:
+        """Cached function that translates a single character,
+        given the input encoding, into its LaTeX text and tokens,
+        or returns ``None`` if the character has no translation.
+        Each table has its own cache, which is cleared by :meth:`register`
+        only, so it ignores direct changes to :attr:`latex_map`.
+        """
+        if self._char_translator is None:
+            # bind latex_map rather than self, so the cache does not
+            # keep the table alive
+            self._char_translator = functools.lru_cache(maxsize=4096)(
+                functools.partial(_translate_char, self.latex_map)
+            )
+        return self._char_translator
 
 
 _LATEX_UNICODE_TABLE = LatexUnicodeTable(lexer.LatexIncrementalDecoder())
 
+# trie node of token sequences that cannot be completed into a match
+_NO_TRIE_NODE: Dict[Optional[lexer.Token], Any] = {}
+
 # incremental encoder does not need a buffer
 # but decoder does
 
@@ -245,14 +344,20 @@ class LatexIncrementalEncoder(lexer.LatexIncrementalEncoder):
     emptytoken = lexer.Token("unknown", "")  #: The empty token.
     table = _LATEX_UNICODE_TABLE  #: Translation table.
     state: str
+    # output and new state for each translated (character, state) pair
+    _char_cache: Dict[Tuple[str, str], Tuple[str, str, str]]
+    # input encoding and table translator that _char_cache is for
+    _char_cache_key: Optional[Tuple[str, Callable]]
 
     def __init__(self, errors="strict"):
         super().__init__(errors=errors)
         self.reset()
 
     def reset(self):
-        super(LatexIncrementalEncoder, self).reset()
+        super().reset()
         self.state = "M"
+        self._char_cache = {}
+        self._char_cache_key = None
 
     def get_space_bytes(self, bytes_: str) -> Tuple[str, str]:
         """Inserts space bytes in space eating mode."""
@@ -271,48 +376,39 @@ class LatexIncrementalEncoder(lexer.LatexIncrementalEncoder):
     def _get_latex_chars_tokens_from_char(
         self, c: str
     ) -> Tuple[str, Tuple[lexer.Token, ...]]:
-        # if ascii, try latex equivalents
-        # (this covers \, #, &, and other special LaTeX characters)
-        if ord(c) < 128:
-            try:
-                return self.table.latex_map[c]
-            except KeyError:
-                pass
-        # next, try input encoding
-        try:
-            c.encode(self.inputenc, "strict")
-        except UnicodeEncodeError:
-            pass
+        translation = self.table.get_char_translator()(self.inputenc, c)
+        if translation is not None:
+            return translation
         else:
+            return self._get_latex_chars_tokens_from_error(c)
+
+    def _get_latex_chars_tokens_from_error(
+        self, c: str
+    ) -> Tuple[str, Tuple[lexer.Token, ...]]:
+        # translation failed
+        if self.errors == "strict":
+            raise UnicodeEncodeError(
+                "latex",  # codec
+                c,  # problematic input
+                0,
+                1,  # location of problematic character
+                "don't know how to translate {0} into latex".format(repr(c)),
+            )
+        elif self.errors == "ignore":
+            return "", (self.emptytoken,)
+        elif self.errors == "replace":
+            # use the \\char command
+            # this assumes
+            # \usepackage[T1]{fontenc}
+            # \usepackage[utf8]{inputenc}
+            bytes_ = "{\\char" + str(ord(c)) + "}"
+            return bytes_, (lexer.Token(name="chars", text=bytes_),)
+        elif self.errors == "keep":
             return c, (lexer.Token(name="chars", text=c),)
-        # next, try latex equivalents of common unicode characters
-        try:
-            return self.table.latex_map[c]
-        except KeyError:
-            # translation failed
-            if self.errors == "strict":
-                raise UnicodeEncodeError(
-                    "latex",  # codec
-                    c,  # problematic input
-                    0,
-                    1,  # location of problematic character
-                    "don't know how to translate {0} into latex".format(repr(c)),
-                )
-            elif self.errors == "ignore":
-                return "", (self.emptytoken,)
-            elif self.errors == "replace":
-                # use the \\char command
-                # this assumes
-                # \usepackage[T1]{fontenc}
-                # \usepackage[utf8]{inputenc}
-                bytes_ = "{\\char" + str(ord(c)) + "}"
-                return bytes_, (lexer.Token(name="chars", text=bytes_),)
-            elif self.errors == "keep":
-                return c, (lexer.Token(name="chars", text=c),)
-            else:
-                raise ValueError(
-                    "latex codec does not support {0} errors".format(self.errors)
-                )
+        else:
+            raise ValueError(
+                "latex codec does not support {0} errors".format(self.errors)
+            )
 
     def get_latex_chars(self, unicode_: str, final: bool = False) -> Iterator[str]:
         if not isinstance(unicode_, str):
@@ -321,16 +417,48 @@ class LatexIncrementalEncoder(lexer.LatexIncrementalEncoder):
                     unicode_.__class__.__name__
                 )
             )
+        char_cache_key = (self.inputenc, self.table.get_char_translator())
+        if self._char_cache_key != char_cache_key:
+            # table or input encoding changed since the cache was filled
+            self._char_cache = {}
+            self._char_cache_key = char_cache_key
+        pos = 0
+        for match in self.table.get_plain_regexp().finditer(unicode_):
+            yield from self._get_latex_chars_per_char(unicode_[pos : match.start()])
+            # fast path: a run of ascii characters that encode as themselves
+            space, bytes_ = self.get_space_bytes(match[0])
+            self.state = "M"
+            if space:
+                yield space
+            yield bytes_
+            pos = match.end()
+        yield from self._get_latex_chars_per_char(unicode_[pos:])
+
+    def _get_latex_chars_per_char(self, unicode_: str) -> Iterator[str]:
         # convert character by character
-        for pos, c in enumerate(unicode_):
-            bytes_, tokens = self._get_latex_chars_tokens_from_char(c)
-            space, bytes_ = self.get_space_bytes(bytes_)
-            # update state
-            if tokens and tokens[-1].name == "control_word":
-                # we're eating spaces
-                self.state = "S"
-            elif tokens:
-                self.state = "M"
+        char_cache = self._char_cache
+        translator = self.table.get_char_translator()
+        for c in unicode_:
+            key = (c, self.state)
+            try:
+                space, bytes_, self.state = char_cache[key]
+            except KeyError:
+                translation = translator(self.inputenc, c)
+                if translation is not None:
+                    bytes_, tokens = translation
+                else:
+                    bytes_, tokens = self._get_latex_chars_tokens_from_error(c)
+                space, bytes_ = self.get_space_bytes(bytes_)
+                # update state
+                if tokens and tokens[-1].name == "control_word":
+                    # we're eating spaces
+                    self.state = "S"
+                elif tokens:
+                    self.state = "M"
+                # only cache actual translations: the output for
+                # untranslatable characters depends on self.errors
+                if translation is not None:
+                    char_cache[key] = space, bytes_, self.state
             if space:
                 yield space
             yield bytes_
@@ -341,13 +469,17 @@ class LatexIncrementalDecoder(lexer.LatexIncrementalDecoder):
 
     table = _LATEX_UNICODE_TABLE  #: Translation table.
     token_buffer: List[lexer.Token]  #: The token buffer of this decoder.
+    #: Node of :attr:`LatexUnicodeTable.unicode_trie` reached by
+    #: each suffix of the token buffer.
+    trie_nodes: List[Dict[Optional[lexer.Token], Any]]
 
     def __init__(self, errors="strict"):
-        lexer.LatexIncrementalDecoder.__init__(self, errors=errors)
+        super().__init__(errors=errors)
 
     def reset(self):
-        lexer.LatexIncrementalDecoder.reset(self)
+        super().reset()
         self.token_buffer = []
+        self.trie_nodes = []
 
     # python codecs API does not support multibuffer incremental decoders
 
@@ -358,36 +490,40 @@ class LatexIncrementalDecoder(lexer.LatexIncrementalDecoder):
         raise NotImplementedError
 
     def get_unicode_tokens(self, chars: str, final: bool = False) -> Iterator[str]:
+        trie = self.table.unicode_trie
         for token in self.get_tokens(chars, final=final):
             # at this point, token_buffer does not match anything
             self.token_buffer.append(token)
-            # new token appended at the end, see if we have a match now
+            # advance the trie node of every suffix of the buffer
+            # by the new token, starting a new suffix at the root
+            self.trie_nodes.append(trie)
+            self.trie_nodes = [
+                node.get(token, _NO_TRIE_NODE) for node in self.trie_nodes
+            ]
+            # see if we have a match now
             # note: match is only possible at the *end* of the buffer
             # because all other positions have already been checked in
-            # earlier iterations
-            for i in range(len(self.token_buffer), 0, -1):
-                last_tokens = tuple(self.token_buffer[-i:])  # last i tokens
-                try:
-                    unicode_text = self.table.unicode_map[last_tokens]
-                except KeyError:
-                    # no match: continue
-                    continue
-                else:
+            # earlier iterations; the longest match wins
+            for i, node in enumerate(self.trie_nodes):
+                if None in node:
                     # match!! flush buffer, and translate last bit
-                    # exclude last i tokens
-                    for token2 in self.token_buffer[:-i]:
+                    # exclude last tokens from position i
+                    for token2 in self.token_buffer[:i]:
                         yield self.decode_token(token2)
-                    yield unicode_text
+                    yield node[None]
                     self.token_buffer = []
+                    self.trie_nodes = []
                     break
             # flush tokens that can no longer match
-            while len(self.token_buffer) >= self.table.max_length:
+            while self.trie_nodes and not self.trie_nodes[0]:
+                del self.trie_nodes[0]
                 yield self.decode_token(self.token_buffer.pop(0))
         # also flush the buffer at the end
         if final:
             for token in self.token_buffer:
                 yield self.decode_token(token)
             self.token_buffer = []
+            self.trie_nodes = []
 
 
 class LatexCodec(codecs.Codec):
@@ -62,6 +62,9 @@ class Token(NamedTuple):
     text: str
 
 
+_tuple_new = tuple.__new__
+
+
 # implementation note: we derive from IncrementalDecoder because this
 # class serves excellently as a base class for incremental decoders,
 # but of course we don't decode yet until later
@@ -69,16 +72,25 @@ class Token(NamedTuple):
 
 class MetaRegexpLexer(ABCMeta):
     """Metaclass for :class:`RegexpLexer`. Compiles tokens into a
-    regular expression.
+    regular expression. The expression is only compiled if the class
+    tokens differ from the ones the inherited expression was compiled
+    from; other subclasses (such as the ones
+    created on the fly by :func:`latexcodec.codec.find_latex`)
+    share the compiled expression of their base class.
     """
 
     def __init__(cls, name, bases, dct):
         super().__init__(name, bases, dct)
+        tokens = getattr(cls, "tokens", ())
+        if tokens is getattr(cls, "_regexp_tokens", None):
+            return
         regexp_string = "|".join(
-            "(?P<" + name + ">" + regexp + ")"
-            for name, regexp in getattr(cls, "tokens", [])
+            f"(?P<{token_name}>{regexp})" for token_name, regexp in tokens
         )
+        # DOTALL ensures that a catch-all "." token also matches newlines,
+        # so finditer never silently skips characters
         cls.regexp = re.compile(regexp_string, re.DOTALL)
+        cls._regexp_tokens = tokens
 
 
 class RegexpLexer(codecs.IncrementalDecoder, metaclass=MetaRegexpLexer):
@@ -122,16 +134,18 @@ class RegexpLexer(codecs.IncrementalDecoder, metaclass=MetaRegexpLexer):
         if self.raw_buffer.text:
             chars = self.raw_buffer.text + chars
         self.raw_buffer = self.emptytoken
-        for match in self.regexp.finditer(chars):
-            # yield the buffer token
-            if self.raw_buffer.text:
-                yield self.raw_buffer
-            # fill buffer with next token
-            assert match.lastgroup is not None
-            self.raw_buffer = Token(match.lastgroup, match.group(0))
+        # tokenize all at once, rather than one match at a time
+        # (tuple.__new__ skips the Python level Token.__new__ call)
+        tokens = [
+            _tuple_new(Token, (match.lastgroup, match[0]))
+            for match in self.regexp.finditer(chars)
+        ]
+        if tokens:
+            # fill buffer with last token, as it may be incomplete
+            self.raw_buffer = tokens.pop()
+        yield from tokens
         if final:
-            for token in self.flush_raw_tokens():
-                yield token
+            yield from self.flush_raw_tokens()
 
     def flush_raw_tokens(self) -> Iterator[Token]:
         """Flush the raw token buffer."""
@@ -145,6 +159,20 @@ class LatexLexer(RegexpLexer, ABC):
 
     # implementation note: every token **must** be decodable by inputenc
     tokens = [
+        # plain characters are by far the most common, so try them first;
+        # they never start with any of the characters that the other
+        # tokens start with, so the order does not affect the result
+        # note: some chars joined together to make it easier to detect
+        # symbols that have a special function (i.e. --, ---, etc.)
+        (
+            "chars",
+            # separate chars because brackets are optional
+            # e.g. fran\\c cais = fran\\c{c}ais in latex
+            # so only way to detect \\c acting on c only is this way
+            # (single chars that cannot start a longer symbol go first)
+            r"[^-`'?! %#$\n\t\\]"
+            r"|---|--|-|``|''|\?`|!`|[`'?!]",
+        ),
         # match newlines and percent first, to ensure comments match correctly
         ("control_symbol_x2", r"[\\][\\]|[\\]%"),
         # comment: for ease, and for speed, we handle it as a token
@@ -169,16 +197,6 @@ class LatexLexer(RegexpLexer, ABC):
         ("space", r" |\t"),
         ("newline", r"\n"),
         ("mathshift", r"[$][$]|[$]"),
-        # note: some chars joined together to make it easier to detect
-        # symbols that have a special function (i.e. --, ---, etc.)
-        (
-            "chars",
-            r"---|--|-|[`][`]" r"|['][']" r"|[?][`]|[!][`]"
-            # separate chars because brackets are optional
-            # e.g. fran\\c cais = fran\\c{c}ais in latex
-            # so only way to detect \\c acting on c only is this way
-            r"|(?![ %#$\n\t\\]).",
-        ),
         # trailing garbage which we cannot decode otherwise
         # (such as a lone '\' at the end of a buffer)
         # is never emitted, but used internally by the buffer
@@ -202,6 +220,17 @@ class LatexIncrementalLexer(LatexLexer, ABC):
     replacetoken = Token("chars", "\ufffd")
     curlylefttoken = Token("chars", "{")
     curlyrighttoken = Token("chars", "}")
+    #: State following tokens that are emitted without further processing.
+    simple_token_states = {
+        "chars": "M",
+        "parameter": "M",
+        # go to space skip mode
+        "control_word": "S",
+        "control_symbol": "S",
+        # don't skip following space, so go to M mode
+        "control_symbol_x": "M",
+        "control_symbol_x2": "M",
+    }
     state: str
     inline_math: bool
 
@@ -234,10 +263,17 @@ class LatexIncrementalLexer(LatexLexer, ABC):
         # current position relative to the start of chars in the sequence
         # of bytes that have been decoded
         pos = -len(self.raw_buffer.text)
+        simple_token_states = self.simple_token_states
         for token in self.get_raw_tokens(chars, final=final):
             pos = pos + len(token.text)
             assert pos >= 0  # first token includes at least self.raw_buffer
-            if token.name == "newline":
+            state = simple_token_states.get(token.name)
+            if state is not None:
+                # chars, parameters, and control sequences:
+                # these are emitted as is, and only change the state
+                self.state = state
+                yield token
+            elif token.name == "newline":
                 if self.state == "N":
                     # if state was 'N', generate new paragraph
                     yield self.partoken
@@ -268,28 +304,10 @@ class LatexIncrementalLexer(LatexLexer, ABC):
                 self.inline_math = not self.inline_math
                 self.state = "M"
                 yield token
-            elif token.name == "parameter":
-                self.state = "M"
-                yield token
-            elif token.name == "control_word":
-                # go to space skip mode
-                self.state = "S"
-                yield token
-            elif token.name == "control_symbol":
-                # go to space skip mode
-                self.state = "S"
-                yield token
-            elif token.name == "control_symbol_x" or token.name == "control_symbol_x2":
-                # don't skip following space, so go to M mode
-                self.state = "M"
-                yield token
             elif token.name == "comment":
                 # no token is generated
                 # note: comment does not include the newline
                 self.state = "S"
-            elif token.name == "chars":
-                self.state = "M"
-                yield token
             elif token.name == "unknown":
                 if self.errors == "strict":
                     # current position within chars
@@ -326,7 +344,7 @@ class LatexIncrementalDecoder(LatexIncrementalLexer):
     """Input encoding. **Must** extend ascii."""
 
     def __init__(self, errors: str = "strict") -> None:
-        super(LatexIncrementalDecoder, self).__init__(errors)
+        super().__init__(errors)
         self.decoder = codecs.getincrementaldecoder(self.inputenc)(errors)
 
     def decode_token(self, token: Token) -> str:
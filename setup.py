@@ -1,13 +1,10 @@
-# -*- coding: utf-8 -*-
-
-import io
+from pathlib import Path
 
 from setuptools import find_packages, setup
 
 
 def readfile(filename):
-    with io.open(filename, encoding="utf-8") as stream:
-        return stream.read().split("\n")
+    return Path(filename).read_text(encoding="utf-8").split("\n")
 
 
 readme = readfile("README.rst")[5:]  # skip title and badges
@@ -32,12 +29,11 @@ setup(
         "Operating System :: OS Independent",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
         "Topic :: Text Processing :: Markup :: LaTeX",
         "Topic :: Text Processing :: Filters",
     ],
@@ -1,8 +1,5 @@
-# -*- coding: utf-8 -*-
 """Tests for the latex codec."""
 
-from __future__ import print_function
-
 import codecs
 from io import BytesIO
 from unittest import TestCase
@@ -20,6 +17,16 @@ def test_find_latex():
     assert latexcodec.codec.find_latex("hello") is None
 
 
+def test_decoder_invalid_type():
+    with pytest.raises(TypeError):
+        codecs.getdecoder("latex")(object())  # type: ignore
+
+
+def test_encoder_invalid_type():
+    with pytest.raises(TypeError):
+        codecs.getencoder("latex")(object())  # type: ignore
+
+
 def test_latex_incremental_decoder_getstate():
     encoder = codecs.getincrementaldecoder("latex")()
     with pytest.raises(NotImplementedError):
@@ -33,15 +40,104 @@ def test_latex_incremental_decoder_setstate():
         encoder.setstate(state)
 
 
+def test_unicode_trie():
+    table = latexcodec.codec._LATEX_UNICODE_TABLE
+    for tokens, unicode_text in table.unicode_map.items():
+        node = table.unicode_trie
+        for token in tokens:
+            node = node[token]
+        assert node[None] == unicode_text
+
+
+def test_decoder_flushes_dead_prefix():
+    table = latexcodec.codec.LatexUnicodeTable(
+        latexcodec.lexer.LatexIncrementalDecoder()
+    )
+    for unicode_text, latex in [("X", "\\foo\\bar\\baz"), ("Y", "\\bar\\qux")]:
+        table.register(
+            latexcodec.codec.UnicodeLatexTranslation(
+                unicode=unicode_text,
+                latex=latex,
+                encode=False,
+                decode=True,
+                text_mode=True,
+                math_mode=False,
+            )
+        )
+    decoder = type(
+        "decoder", (latexcodec.codec.LatexIncrementalDecoder,), dict(table=table)
+    )()
+    # \foo\bar is a prefix of X but \qux kills it: \foo must be
+    # flushed so that \bar\qux can still match Y
+    input_ = b"\\foo\\bar\\qux \\foo\\bar\\baz"
+    output = "".join(
+        decoder.decode(bytes_, final=final) for bytes_, final in split_input(input_)
+    )
+    assert output == "\\foo YX"
+
+
+def test_register_keeps_other_tables_unchanged():
+    table = latexcodec.codec.LatexUnicodeTable(
+        latexcodec.lexer.LatexIncrementalDecoder()
+    )
+    encoder = type(
+        "encoder", (latexcodec.codec.LatexIncrementalEncoder,), dict(table=table)
+    )(errors="replace")
+    assert "\u2603".encode("latex", "replace") == b"{\\char9731}"
+    assert encoder.encode("\u2603", final=True) == b"{\\char9731}"
+    table.register(
+        latexcodec.codec.UnicodeLatexTranslation(
+            unicode="\u2603",
+            latex="\\snowman",
+            encode=True,
+            decode=True,
+            text_mode=True,
+            math_mode=False,
+        )
+    )
+    assert "\u2603".encode("latex", "replace") == b"{\\char9731}"
+    assert encoder.encode("\u2603", final=True) == b"\\snowman"
+
+
+def test_register_updates_encoder():
+    table = latexcodec.codec.LatexUnicodeTable(
+        latexcodec.lexer.LatexIncrementalDecoder()
+    )
+    encoder = type(
+        "encoder", (latexcodec.codec.LatexIncrementalEncoder,), dict(table=table)
+    )(errors="replace")
+    assert table.get_plain_regexp().fullmatch("a@b")
+    assert encoder.encode("a@b\u2603", final=True) == b"a@b{\\char9731}"
+    for char, latex in [("@", "\\at"), ("\u2603", "\\snowman")]:
+        table.register(
+            latexcodec.codec.UnicodeLatexTranslation(
+                unicode=char,
+                latex=latex,
+                encode=True,
+                decode=True,
+                text_mode=True,
+                math_mode=False,
+            )
+        )
+    assert not table.get_plain_regexp().fullmatch("a@b")
+    assert encoder.encode("a@b\u2603", final=True) == b"a\\at b\\snowman"
+
+
+def test_encoder_errors_changed_midstream():
+    encoder = codecs.getincrementalencoder("latex")(errors="replace")
+    assert encoder.encode("\u2328") == b"{\\char9000}"
+    encoder.errors = "strict"
+    with pytest.raises(ValueError):
+        encoder.encode("\u2328")
+
+
 def split_input(input_):
     """Helper function for testing the incremental encoder and decoder."""
     assert isinstance(input_, (str, bytes))
     if input_:
+        last = len(input_) - 1
         for i in range(len(input_)):
-            if i + 1 < len(input_):
-                yield input_[i : i + 1], False
-            else:
-                yield input_[i : i + 1], True
+            yield input_[i : i + 1], i == last
     else:
         yield input_, True
 
@@ -57,10 +153,6 @@ class TestDecoder(TestCase):
         decoded, n = codecs.getdecoder(encoding)(text_latex)
         self.assertEqual((decoded, n), (text_utf8, len(text_latex)))
 
-    def test_invalid_type(self):
-        with pytest.raises(TypeError):
-            codecs.getdecoder("latex")(object())  # type: ignore
-
     def test_invalid_code(self):
         with pytest.raises(ValueError):
             # b'\xe9' is invalid utf-8 code
@@ -247,10 +339,6 @@ class TestStreamDecoder(TestDecoder):
         reader = codecs.getreader(encoding)(stream)
         self.assertEqual(text_utf8, reader.read())
 
-    # in this test, BytesIO(object()) is eventually called
-    def test_invalid_type(self):
-        TestDecoder.test_invalid_type(self)
-
 
 class TestIncrementalDecoder(TestDecoder):
     """Incremental decoder tests."""
@@ -258,10 +346,10 @@ class TestIncrementalDecoder(TestDecoder):
     def decode(self, text_utf8, text_latex, inputenc=None):
         encoding = "latex+" + inputenc if inputenc else "latex"
         decoder = codecs.getincrementaldecoder(encoding)()
-        decoded_parts = (
+        decoded_parts = [
             decoder.decode(text_latex_part, final)
             for text_latex_part, final in split_input(text_latex)
-        )
+        ]
         self.assertEqual(text_utf8, "".join(decoded_parts))
 
 
@@ -274,10 +362,6 @@ class TestEncoder(TestCase):
         encoded, n = codecs.getencoder(encoding)(text_utf8, errors=errors)
         self.assertEqual((encoded, n), (text_latex, len(text_utf8)))
 
-    def test_invalid_type(self):
-        with pytest.raises(TypeError):
-            codecs.getencoder("latex")(object())  # type: ignore
-
     # note concerning test_invalid_code_* methods:
     # '\u2328' (0x2328 = 9000) is unicode for keyboard symbol
     # we currently provide no translation for this into LaTeX code
@@ -454,10 +538,10 @@ class TestIncrementalEncoder(TestEncoder):
     def encode(self, text_utf8, text_latex, inputenc=None, errors="strict"):
         encoding = "latex+" + inputenc if inputenc else "latex"
         encoder = codecs.getincrementalencoder(encoding)(errors=errors)
-        encoded_parts = (
+        encoded_parts = [
             encoder.encode(text_utf8_part, final)
             for text_utf8_part, final in split_input(text_utf8)
-        )
+        ]
         self.assertEqual(text_latex, b"".join(encoded_parts))
 
 
@@ -1,7 +1,5 @@
-# -*- coding: utf-8 -*-
-
 """Tests for the tex lexer."""
-from typing import Generic, Iterator, List, Type, TypeVar
+from typing import Generic, Iterator, List, Tuple, Type, TypeVar
 from unittest import TestCase
 
 import pytest
@@ -53,6 +51,41 @@ def test_token_assign_other():
         t.blabla = "test"  # type: ignore
 
 
+class MockTokensMixin:
+    tokens: List[Tuple[str, str]] = [
+        ("word", "[a-z]+"),
+        ("unknown", "."),
+    ]
+
+
+class MockMixinIncrementalDecoder(  # type: ignore[misc]
+    MockTokensMixin, LatexIncrementalDecoder
+):
+    pass
+
+
+def test_regexp_shared_with_subclass():
+    assert LatexIncrementalDecoder.regexp is LatexLexer.regexp
+    assert MockIncrementalDecoder.regexp is not LatexLexer.regexp
+    assert MockMixinIncrementalDecoder.regexp is not LatexLexer.regexp
+    tokens = MockMixinIncrementalDecoder().get_raw_tokens("abc d", final=True)
+    assert list(tokens) == [
+        Token("word", "abc"),
+        Token("unknown", " "),
+        Token("word", "d"),
+    ]
+
+
+def test_final_calls_flush_raw_tokens():
+    class FlushLexer(LatexIncrementalDecoder):
+        def flush_raw_tokens(self) -> Iterator[Token]:
+            for token in super().flush_raw_tokens():
+                yield Token(token.name, token.text.upper())
+
+    tokens = FlushLexer().get_raw_tokens("ab", final=True)
+    assert [token.text for token in tokens] == ["a", "B"]
+
+
 class BaseLatexLexerTest(TestCase):
 
     errors = "strict"